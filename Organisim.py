@@ -1,13 +1,37 @@
+import numpy as np
+
+
 class Organism:
     """Basic value object representing an organism on the habitat grid."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "row",
+        "col",
+        "imagePath",
+        "fecundity",
+        "size",
+        "genes",
+        "_gene_matrix",
+        "moves",
+        "ideal_traits",
+        "user_ideal_traits",
+        "trait_names",
+        "_cycle_steps",
+        "_caught_prey",
+        "_caught_prey_count",
+        "_was_caught",
+        "_times_caught",
+    )
+
     def __init__(
         self,
         i,
         n,
         r,
         c,
-        size,
+        *,
         ip=None,
         fecundity=1.0,
         moves=True,
@@ -21,8 +45,9 @@ class Organism:
         self.col = c
         self.imagePath = ip
         self.fecundity = fecundity #amt of offspring a species should have: apex predator is like 1-3, bug is like hundreds.
-        self.size = size
+        self.size = 0 # kept equal to len(genes) by setGenes
         self.genes = [] #deap gene values
+        self._gene_matrix = None
         self.moves = moves
         self.ideal_traits = list(ideal_traits) if ideal_traits is not None else []
         self.user_ideal_traits = list(user_ideal_traits) if user_ideal_traits is not None else None
@@ -70,16 +95,35 @@ class Organism:
         return self.fecundity
     
     def getSize(self):
-        return len(self.genes)
-    
-    def setSize(self, num):
-        self.size = num
+        return self.size
 
     def getGenes(self):
         return self.genes
     
     def setGenes(self, list):
         self.genes = list
+        self.size = len(list)
+        self._gene_matrix = None
+
+    def getGeneMatrix(self):
+        """
+        Return the genes as a contiguous float32 `(size, trait_count)` array.
+
+        Built on first use and kept until `setGenes`; `genes` stays the list of DEAP
+        individuals the evolution population shares. Returns None for ragged genomes.
+        """
+        if self._gene_matrix is None:
+            try:
+                matrix = np.asarray(self.genes, dtype=np.float32)
+            except (TypeError, ValueError):
+                return None
+            if matrix.ndim == 1:
+                # Scalar genomes become one-trait rows; an empty pool has no traits at all.
+                matrix = matrix.reshape(-1, 1) if matrix.size else matrix.reshape(0, 0)
+            elif matrix.ndim != 2:
+                return None
+            self._gene_matrix = matrix
+        return self._gene_matrix
 
     def setFecundity(self, fecundity):
         self.fecundity = fecundity
@@ -120,18 +164,26 @@ class Organism:
     def getCaughtPreyCount(self):
         return self._caught_prey_count
 
+    def setCaughtPreyFlag(self, caught):
+        self._caught_prey = caught
+        self._caught_prey_count = int(caught)
+        return caught
+
+    def setCaughtPreyCount(self, count):
+        count = count if count > 0 else 0
+        self._caught_prey_count = count
+        self._caught_prey = count > 0
+        return self._caught_prey
+
     def setCaughtPrey(self, caught=True):
+        """Accept either a flag or a count; internal callers should use the typed setters."""
         if isinstance(caught, bool):
-            self._caught_prey = caught
-            self._caught_prey_count = int(bool(caught))
-        else:
-            try:
-                count = int(caught)
-            except (TypeError, ValueError):
-                count = 0
-            self._caught_prey_count = max(0, count)
-            self._caught_prey = self._caught_prey_count > 0
-        return self._caught_prey
+            return self.setCaughtPreyFlag(caught)
+        try:
+            count = int(caught)
+        except (TypeError, ValueError):
+            count = 0
+        return self.setCaughtPreyCount(count)
 
     def incrementCaughtPrey(self, count=1):
         try:
@@ -171,18 +223,26 @@ class Organism:
     def getTimesCaught(self):
         return self._times_caught
 
+    def setWasCaughtFlag(self, caught):
+        self._was_caught = caught
+        self._times_caught = int(caught)
+        return caught
+
+    def setTimesCaught(self, count):
+        count = count if count > 0 else 0
+        self._times_caught = count
+        self._was_caught = count > 0
+        return self._was_caught
+
     def setWasCaught(self, caught=True):
+        """Accept either a flag or a count; internal callers should use the typed setters."""
         if isinstance(caught, bool):
-            self._was_caught = caught
-            self._times_caught = int(bool(caught))
-        else:
-            try:
-                count = int(caught)
-            except (TypeError, ValueError):
-                count = 0
-            self._times_caught = max(0, count)
-            self._was_caught = self._times_caught > 0
-        return self._was_caught
+            return self.setWasCaughtFlag(caught)
+        try:
+            count = int(caught)
+        except (TypeError, ValueError):
+            count = 0
+        return self.setTimesCaught(count)
 
     def incrementTimesCaught(self, count=1):
         try:
@@ -1,10 +1,22 @@
-import copy
+import heapq
+import itertools
+import math
+import operator
 import random
-from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from deap import base, creator, tools
 
+BLEND_ALPHA = 0.5
+MUTATION_SIGMA = 0.25
+MUTATION_INDPB = 0.6
+
+# Traits live in [0, 1] and fitness is an L1 distance, so single precision is plenty for the
+# trait matrices; scores are still accumulated in float64.
+TRAIT_DTYPE = np.float32
+
 
 @dataclass
 class EvolutionContext:
@@ -25,6 +37,45 @@ class EvolutionContext:
     perfectly_matching_score: int
     target_population_baseline: int
     target_traits_override: Optional[Sequence[float]] = None
+    map_fn: Optional[Callable] = None
+    individual_pool: List = field(default_factory=list, repr=False)
+    rng: np.random.Generator = field(default_factory=np.random.default_rng, repr=False)
+    _targets_np: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _targets_source: Optional[Sequence[float]] = field(default=None, init=False, repr=False)
+    _scratch: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+
+    def target_array(self) -> np.ndarray:
+        """Return the active targets as a `TRAIT_DTYPE` array, rebuilt only when the override changes."""
+        targets = self.target_traits_override or self.target_traits
+        if self._targets_np is None or targets is not self._targets_source:
+            self._targets_np = np.asarray(targets, dtype=TRAIT_DTYPE)
+            self._targets_source = targets
+        return self._targets_np
+
+    def scratch(self, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Return a `TRAIT_DTYPE` work buffer of `shape`, reusing the one kept under `name`.
+
+        Buffers only grow, so after the first few generations no per-generation allocation is
+        needed. Contents are undefined and only valid until the next call with the same name.
+        """
+        size = math.prod(shape)
+        buffer = self._scratch.get(name)
+        if buffer is None or buffer.shape[0] < size:
+            capacity = max(size, 2 * self.max_population_size * len(self.target_traits))
+            buffer = self._scratch[name] = np.empty(capacity, dtype=TRAIT_DTYPE)
+        return buffer[:size].reshape(shape)
+
+    def set_target_override(self, values: Optional[Sequence[float]]) -> None:
+        """Replace the override targets and rebind the scalar evaluator to match."""
+        self.target_traits_override = tuple(values) if values else None
+        targets = self.target_traits_override or self.target_traits
+        self.toolbox.register(
+            "evaluate",
+            _evaluate_against,
+            targets=tuple(targets),
+            perfectly_matching_score=self.perfectly_matching_score,
+        )
 
 
 def _ensure_creators() -> None:
@@ -36,38 +87,233 @@ def _ensure_creators() -> None:
         creator.create("EvoIndividual", list, fitness=creator.FitnessMax)
 
 
-def _scaled_fitness(population: List) -> List[float]:
+# Register the creator classes at import time so building a toolbox never has to.
+_ensure_creators()
+
+
+def _evaluate_against(individual, targets: Tuple[float, ...], perfectly_matching_score: int):
+    """
+    Score individuals by similarity to `targets`.
+
+    A perfect match returns `perfectly_matching_score` and larger scores mean higher fitness.
+    This is a plain module-level function so the registered partial pickles for `map_fn`.
+    """
+    difference = math.fsum(map(abs, map(operator.sub, individual, targets)))
+    return (perfectly_matching_score - difference,)
+
+
+def _reissue(pool: List, genes, values: Optional[Tuple[float, ...]] = None) -> List:
+    """
+    Hand out an individual holding `genes`, reviving a retired one when the pool has any.
+
+    `values` becomes its fitness; without it the fitness is left invalid.
+    """
+    if pool:
+        individual = pool.pop()
+        individual[:] = genes
+        if values is None and individual.fitness.valid:
+            del individual.fitness.values
+    else:
+        individual = creator.EvoIndividual(genes)
+    if values is not None:
+        individual.fitness.values = values
+    return individual
+
+
+def _retire(pool: List, individuals, capacity: int) -> None:
+    """
+    Park discarded individuals in the pool so later generations can reuse them.
+
+    Pooled individuals are overwritten in place when reissued, so only pass ones nothing
+    outside the evolution code can still hold.
+    """
+    room = capacity - len(pool)
+    if room > 0:
+        pool.extend(itertools.islice(individuals, room))
+
+
+def _scaled_fitness(fitness: np.ndarray) -> np.ndarray:
     """Normalize fitness scores so roulette selection remains stable."""
-    if not population:
-        return []
+    if fitness.size == 0:
+        return fitness
 
-    raw_scores = [individual.fitness.values[0] for individual in population]
-    minimum = min(raw_scores)
+    minimum = fitness.min()
     offset = -minimum + 1e-9 if minimum < 0 else 1e-9
-    return [score + offset for score in raw_scores]
+    return fitness + offset
 
 
-def _select_roulette_scaled(population: List, count: int) -> List:
-    """Roulette selection that uses scaled fitness to keep probabilities positive."""
-    if count <= 0 or not population:
-        return []
+def _roulette_indices(weights: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Roulette selection over non-negative `weights` (see `_scaled_fitness`).
+
+    Returns the selected positions.
+    """
+    size = weights.shape[0]
+    if count <= 0 or size == 0:
+        return np.empty(0, dtype=np.intp)
+
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+    if total <= 0:
+        picks = rng.integers(size, size=count)
+    else:
+        picks = np.searchsorted(cumulative, rng.random(count) * total, side="right")
+        np.minimum(picks, size - 1, out=picks)
+    return picks
+
+
+def _score_rows(genes: np.ndarray, context: EvolutionContext) -> np.ndarray:
+    """Return the fitness score of each row of a `(count, trait_count)` gene matrix."""
+    targets = context.target_array()
+    width = min(genes.shape[1], targets.shape[0])
+    distance = context.scratch("distance", (genes.shape[0], width))
+    np.subtract(genes[:, :width], targets[:width], out=distance)
+    np.abs(distance, out=distance)
+    scores = distance.sum(axis=1, dtype=np.float64)
+    return np.subtract(context.perfectly_matching_score, scores, out=scores)
+
+
+def _score_batch(individuals: List, context: EvolutionContext) -> np.ndarray:
+    """Return the fitness score of each individual, computed as one array operation."""
+    trait_count = len(context.target_traits)
+    genes = np.fromiter(
+        itertools.chain.from_iterable(individuals),
+        dtype=TRAIT_DTYPE,
+        count=len(individuals) * trait_count,
+    ).reshape(len(individuals), trait_count)
+    return _score_rows(genes, context)
+
+
+def _evaluate_invalid(population: List, context: EvolutionContext) -> None:
+    """
+    Score every individual with a stale fitness in a single vectorized pass.
+
+    When the context carries a `map_fn`, the scalar evaluator is mapped through it instead.
+    """
+    invalid = [ind for ind in population if not ind.fitness.valid]
+    if not invalid:
+        return
+
+    if context.map_fn is not None:
+        for individual, fitness in zip(invalid, context.map_fn(context.toolbox.evaluate, invalid)):
+            individual.fitness.values = fitness
+        return
+
+    for individual, score in zip(invalid, _score_batch(invalid, context).tolist()):
+        individual.fitness.values = (score,)
+
+
+def _breed_kernel(genes: np.ndarray, gamma: np.ndarray, noise: np.ndarray) -> None:
+    """
+    Apply blend crossover, Gaussian noise, and clamping to `genes` in place.
 
-    weights = _scaled_fitness(population)
-    if not weights or sum(weights) <= 0:
-        return random.choices(population, k=count)
-    return random.choices(population, weights=weights, k=count)
+    `gamma` holds one blend weight per pair and gene (zero for pairs that do not cross) and
+    `noise` is already masked down to the genes that mutate, so every pair goes through the
+    same branch-free arithmetic. Children are clamped after the blend and again after the
+    noise, so mutation always starts from in-range values.
+    """
+    first = genes[:, 0]
+    second = genes[:, 1]
+    spread = np.subtract(second, first)
+    spread *= gamma
+    first += spread
+    second -= spread
+    np.clip(genes, 0.0, 1.0, out=genes)
+    genes += noise
+    np.clip(genes, 0.0, 1.0, out=genes)
+
+
+def _population_arrays(population: List) -> Tuple[np.ndarray, np.ndarray]:
+    """Snapshot an evaluated population as a `(size, trait_count)` trait matrix plus a fitness vector."""
+    size = len(population)
+    trait_count = len(population[0])
+    traits = np.fromiter(
+        itertools.chain.from_iterable(population),
+        dtype=TRAIT_DTYPE,
+        count=size * trait_count,
+    ).reshape(size, trait_count)
+    fitness = np.fromiter((ind.fitness.values[0] for ind in population), dtype=np.float64, count=size)
+    return traits, fitness
+
+
+def _top_indices(fitness: np.ndarray, count: int) -> np.ndarray:
+    """Return the positions of the `count` fittest entries, best first, without a full sort."""
+    if count <= 0:
+        return np.empty(0, dtype=np.intp)
+    if count >= fitness.shape[0]:
+        return np.argsort(-fitness, kind="stable")
+    top = np.argpartition(-fitness, count - 1)[:count]
+    return top[np.argsort(-fitness[top], kind="stable")]
+
+
+def _vary_pairs(genes: np.ndarray, elite_pairs: np.ndarray, context: EvolutionContext) -> np.ndarray:
+    """
+    Cross, mutate, and clamp a `(pairs, 2, trait_count)` parent matrix in place.
+
+    Blend crossover, Gaussian mutation, and clamping each run as a single NumPy operation.
+    Returns a `(pairs, 2)` mask of the rows that changed and therefore need re-scoring.
+    """
+    rng = context.rng
+    pair_count = genes.shape[0]
+
+    # Columns: crossover roll, then one mutation roll per parent.
+    draws = rng.random((pair_count, 3))
+    crossed = elite_pairs | (draws[:, 0] < context.crossover_probability)
+    mutated = draws[:, 1:] < context.mutation_probability
+
+    # Draw into reused scratch buffers; uniform(-a, 1 + a) and normal(0, sigma) are rescaled in place.
+    gamma = rng.random(dtype=TRAIT_DTYPE, out=context.scratch("gamma", genes[:, 0].shape))
+    gamma *= 1.0 + 2.0 * BLEND_ALPHA
+    gamma -= BLEND_ALPHA
+    gamma *= crossed[:, None]
+    noise = rng.standard_normal(dtype=TRAIT_DTYPE, out=context.scratch("noise", genes.shape))
+    noise *= MUTATION_SIGMA
+    noise *= rng.random(dtype=TRAIT_DTYPE, out=context.scratch("mutation_rolls", genes.shape)) < MUTATION_INDPB
+    noise *= mutated[:, :, None]
+
+    _breed_kernel(genes, gamma, noise)
+    return mutated | crossed[:, None]
+
+
+def _materialize(rows: np.ndarray, changed: np.ndarray, scores: np.ndarray, context: EvolutionContext) -> List:
+    """
+    Wrap gene rows as individuals with their fitness already set.
+
+    Unchanged rows carry over their parent's score and changed rows are re-scored straight
+    from the matrix, so offspring never pass through an invalid fitness. With a `map_fn`
+    on the context, changed rows are left invalid for `_evaluate_invalid` instead.
+    """
+    pool = context.individual_pool
+    if context.map_fn is None:
+        if changed.any():
+            scores = scores.copy()
+            scores[changed] = _score_rows(rows[changed], context)
+        return [_reissue(pool, row, (score,)) for row, score in zip(rows.tolist(), scores.tolist())]
+
+    individuals = [None] * len(rows)
+    for index, (row, flag, score) in enumerate(zip(rows.tolist(), changed.tolist(), scores.tolist())):
+        individuals[index] = _reissue(pool, row, None if flag else (score,))
+    return individuals
+
+
+def _random_individuals(count: int, context: EvolutionContext) -> List:
+    """Draw `count` random individuals from one `(count, trait_count)` uniform block."""
+    if count <= 0:
+        return []
+    rows = context.rng.random((count, len(context.target_traits)), dtype=TRAIT_DTYPE)
+    return _materialize(rows, np.ones(count, dtype=bool), np.empty(count), context)
 
 
 def _roll_immigration_quota(current_size: int, context: EvolutionContext) -> int:
     """Draw the number of immigrants for the next generation."""
-    if current_size == 0 or random.random() > context.immigration_chance:
+    if current_size == 0 or context.rng.random() > context.immigration_chance:
         return 0
 
     base_count = max(1, int(round(current_size * context.immigration_rate)))
     variance = max(1, int(round(base_count * context.immigration_variation)))
     lower = max(1, base_count - variance)
     upper = base_count + variance
-    candidate = random.randint(lower, upper)
+    candidate = int(context.rng.integers(lower, upper, endpoint=True))
     available_space = max(0, context.max_population_size - current_size)
     return max(0, min(candidate, available_space))
 
@@ -85,19 +331,24 @@ def prepare_evolution(
     fecundity_variation: float = 0.15,
     crossover_probability: float = 0.7,
     mutation_probability: float = 0.3,
-    elite_count: int = 2,):
+    elite_count: int = 2,
+    map_fn: Optional[Callable] = None,
+    rng: Optional[random.Random] = None,):
     """
     Configure the DEAP toolbox and seed an initial population.
 
-    Generates number of species in population (clamped), and sets up evoultion context
+    Generates number of species in population (clamped), and sets up evoultion context.
+    `rng` (e.g. `random.Random(seed)`) makes the run reproducible without touching the
+    global `random` state; it seeds the initial traits and the context's NumPy generator.
+    `map_fn` (e.g. `ThreadPoolExecutor.map`) replaces the batched NumPy scoring; it only pays
+    off once a single evaluation costs far more than handing it to a worker, which the
+    current trait-distance fitness (a few microseconds) never does, so it defaults to off.
     """
     if fecundity <= 0:
         raise ValueError("fecundity must be greater than zero.")
     if fecundity_variation < 0:
         raise ValueError("fecundity_variation cannot be negative.")
 
-    _ensure_creators()
-
     trait_count = len(target_traits)
     toolbox = base.Toolbox()
     base_population = max(min_population_size, min(max_population_size, population_size))
@@ -106,22 +357,29 @@ def prepare_evolution(
         min(max_population_size, int(round(base_population * fecundity))),
     )
     perfectly_matching_score = trait_count
+    individual_pool: List = []
+
+    def individual():
+        """Draw a random individual, recycling a retired one when available."""
+        return _reissue(individual_pool, [toolbox.attr_trait() for _ in range(trait_count)])
 
     def clone(individual):
-        """Deep-copy helper because newer DEAP builds skip tools.clone."""
-        return copy.deepcopy(individual)
+        """Copy an individual; genes are flat floats so a list copy is as good as a deep copy."""
+        values = individual.fitness.values if individual.fitness.valid else None
+        return _reissue(individual_pool, individual, values)
 
     def clamp_traits(individual):
         """Keep trait values inside [0, 1] for easier interpretation."""
         for index, gene in enumerate(individual):
             individual[index] = min(max(gene, 0.0), 1.0)
 
-    toolbox.register("attr_trait", random.random)
-    toolbox.register("individual", tools.initRepeat, creator.EvoIndividual, toolbox.attr_trait, trait_count)
+    source = rng if rng is not None else random
+    toolbox.register("attr_trait", source.random)
+    toolbox.register("individual", individual)
     toolbox.register("population", tools.initRepeat, list, toolbox.individual)
     toolbox.register("clone", clone)
-    toolbox.register("mate", tools.cxBlend, alpha=0.5)
-    toolbox.register("mutate", tools.mutGaussian, mu=0.0, sigma=0.25, indpb=0.6)
+    toolbox.register("mate", tools.cxBlend, alpha=BLEND_ALPHA)
+    toolbox.register("mutate", tools.mutGaussian, mu=0.0, sigma=MUTATION_SIGMA, indpb=MUTATION_INDPB)
     toolbox.register("clamp_traits", clamp_traits)
 
     context = EvolutionContext(
@@ -139,19 +397,17 @@ def prepare_evolution(
         elite_count=elite_count,
         perfectly_matching_score=perfectly_matching_score,
         target_population_baseline=target_population_baseline,
+        individual_pool=individual_pool,
+        rng=np.random.default_rng(source.getrandbits(64)),
+        map_fn=map_fn,
     )
 
-    def evaluate(individual, _context=context):
-        """
-        Score individuals by similarity to the current target traits.
-
-        A perfect match returns `perfectly_matching_score` and larger scores mean higher fitness.
-        """
-        targets = _context.target_traits_override or _context.target_traits
-        difference = sum(abs(gene - target) for gene, target in zip(individual, targets))
-        return (_context.perfectly_matching_score - difference,)
-
-    toolbox.register("evaluate", evaluate)
+    toolbox.register(
+        "evaluate",
+        _evaluate_against,
+        targets=tuple(context.target_traits),
+        perfectly_matching_score=perfectly_matching_score,
+    )
     population = toolbox.population(n=base_population)
 
     return population, context
@@ -161,19 +417,18 @@ def advance_population(population: List, context: EvolutionContext, generations:
     """
     Advance a population by one or more generations using the supplied context.
 
-    The population list is mutated in place and also returned for convenience.
+    The population list is mutated in place and also returned for convenience. Individuals
+    passed in are never recycled, so references the caller keeps to them stay intact; only
+    individuals bred and discarded during this call are reused for later offspring.
     """
     if generations <= 0 or not population:
         return population
 
     toolbox = context.toolbox
 
-    for _ in range(generations):
-        invalid_individuals = [ind for ind in population if not ind.fitness.valid]
-        for individual, fitness in zip(invalid_individuals, map(toolbox.evaluate, invalid_individuals)):
-            individual.fitness.values = fitness
+    for generation in range(generations):
+        _evaluate_invalid(population, context)
 
-        _scaled_fitness(population)
         current_size = len(population)
         immigration_quota = _roll_immigration_quota(current_size, context)
         parent_slots = max(current_size, 0)
@@ -183,96 +438,109 @@ def advance_population(population: List, context: EvolutionContext, generations:
         upper_bound = min(context.max_population_size, context.target_population_baseline + variation_span)
         if upper_bound < lower_bound:
             upper_bound = lower_bound
-        target_population = random.randint(lower_bound, upper_bound)
+        target_population = int(context.rng.integers(lower_bound, upper_bound, endpoint=True))
 
-        elite_parents = []
-        for elite in tools.selBest(population, elite_to_keep):
-            elite_clone = toolbox.clone(elite)
-            elite_clone.elite_parent = True
-            elite_parents.append(elite_clone)
+        traits, fitness = _population_arrays(population)
+        elite_indices = _top_indices(fitness, elite_to_keep).tolist()
 
         roulette_slots = parent_slots - elite_to_keep
-        other_parents = []
+        other_indices = []
         if roulette_slots > 0:
-            selected = _select_roulette_scaled(population, roulette_slots)
-            other_parents = [toolbox.clone(individual) for individual in selected]
-
-        random.shuffle(other_parents)
+            selected = _roulette_indices(_scaled_fitness(fitness), roulette_slots, context.rng)
+            other_indices = context.rng.permutation(selected).tolist()
 
+        # Pairs are assembled as population positions; elites pair with roulette parents first.
         breeding_pairs = []
-        remaining_elites = elite_parents[:]
-        while remaining_elites:
-            elite = remaining_elites.pop(0)
-            partner = other_parents.pop(0) if other_parents else None
-            if partner is None and remaining_elites:
-                partner = remaining_elites.pop(0)
-            if partner is not None:
-                breeding_pairs.append((elite, partner))
-
-        while len(other_parents) >= 2:
-            breeding_pairs.append((other_parents.pop(0), other_parents.pop(0)))
-
-        offspring = []
-        for parent1, parent2 in breeding_pairs:
-            elite_in_pair = getattr(parent1, "elite_parent", False) or getattr(parent2, "elite_parent", False)
-            if elite_in_pair or random.random() < context.crossover_probability:
-                toolbox.mate(parent1, parent2)
-                toolbox.clamp_traits(parent1)
-                toolbox.clamp_traits(parent2)
-                if hasattr(parent1.fitness, "values"):
-                    del parent1.fitness.values
-                if hasattr(parent2.fitness, "values"):
-                    del parent2.fitness.values
-
-            if random.random() < context.mutation_probability:
-                toolbox.mutate(parent1)
-                toolbox.clamp_traits(parent1)
-                if hasattr(parent1.fitness, "values"):
-                    del parent1.fitness.values
-
-            if random.random() < context.mutation_probability:
-                toolbox.mutate(parent2)
-                toolbox.clamp_traits(parent2)
-                if hasattr(parent2.fitness, "values"):
-                    del parent2.fitness.values
-
-            offspring.extend([parent1, parent2])
-
-        immigrants = [toolbox.individual() for _ in range(immigration_quota)]
+        paired_elite_slots = []
+        unpaired_elites = []
+        elite_cursor = 0
+        other_cursor = 0
+        while elite_cursor < len(elite_indices):
+            elite = elite_indices[elite_cursor]
+            elite_cursor += 1
+            slot = 2 * len(breeding_pairs)
+            if other_cursor < len(other_indices):
+                breeding_pairs.append((elite, other_indices[other_cursor]))
+                other_cursor += 1
+                paired_elite_slots.append(slot)
+            elif elite_cursor < len(elite_indices):
+                breeding_pairs.append((elite, elite_indices[elite_cursor]))
+                elite_cursor += 1
+                paired_elite_slots.extend((slot, slot + 1))
+            else:
+                unpaired_elites.append(elite)
+        elite_pair_count = len(breeding_pairs)
 
-        elite_copies = [toolbox.clone(elite) for elite in elite_parents]
+        # Pair the remaining roulette parents in order; an odd one out sits this generation out.
+        breeding_pairs.extend(zip(other_indices[other_cursor::2], other_indices[other_cursor + 1 :: 2]))
 
-        new_generation = offspring + immigrants + elite_copies
+        offspring = []
+        if breeding_pairs:
+            pair_positions = np.array(breeding_pairs, dtype=np.intp)
+            parent_genes = context.scratch("parents", pair_positions.shape + traits.shape[1:])
+            np.take(traits, pair_positions, axis=0, out=parent_genes)
+            elite_pairs = np.arange(len(breeding_pairs)) < elite_pair_count
+            changed = _vary_pairs(parent_genes, elite_pairs, context)
+            offspring = _materialize(
+                parent_genes.reshape(pair_positions.size, traits.shape[1]),
+                changed.ravel(),
+                fitness[pair_positions].ravel(),
+                context,
+            )
+
+        immigrants = _random_individuals(immigration_quota, context)
+
+        # Elites that bred are copied as they left the pairing, matching the in-place parent update.
+        elite_copies = [toolbox.clone(offspring[slot]) for slot in paired_elite_slots]
+        elite_copies.extend(toolbox.clone(population[index]) for index in unpaired_elites)
+
+        new_generation = offspring
+        new_generation += immigrants
+        new_generation += elite_copies
+        candidates = new_generation
 
         # If no mating occurred (e.g., a lone survivor), do not fabricate extra individuals.
-        if parent_slots < 2 and not offspring:
+        if parent_slots < 2 and not breeding_pairs:
             target_population = len(new_generation)
 
         if len(new_generation) < target_population:
             deficit = target_population - len(new_generation)
-            new_generation.extend(toolbox.individual() for _ in range(deficit))
+            new_generation.extend(_random_individuals(deficit, context))
 
         if len(new_generation) > target_population:
-            elites = tools.selBest(new_generation, min(context.elite_count, target_population))
-            elite_ids = {id(ind) for ind in elites}
+            # Partial selection by position: O(N log k) instead of sorting the whole generation.
+            elite_positions = heapq.nlargest(
+                min(context.elite_count, target_population),
+                range(len(new_generation)),
+                key=lambda position: new_generation[position].fitness,
+            )
+            elites = [new_generation[position] for position in elite_positions]
             remaining_slots = target_population - len(elites)
             if remaining_slots > 0:
-                others = [ind for ind in new_generation if id(ind) not in elite_ids]
-                sampled = (
-                    random.sample(others, remaining_slots)
-                    if remaining_slots <= len(others)
-                    else others[:remaining_slots]
-                )
-                new_generation = elites + sampled
+                is_elite = np.zeros(len(new_generation), dtype=bool)
+                is_elite[elite_positions] = True
+                other_positions = np.flatnonzero(~is_elite)
+                if remaining_slots <= other_positions.shape[0]:
+                    other_positions = context.rng.choice(other_positions, size=remaining_slots, replace=False)
+                else:
+                    other_positions = other_positions[:remaining_slots]
+                new_generation = elites + [new_generation[position] for position in other_positions.tolist()]
             else:
                 new_generation = elites
 
+        # The caller's individuals may be shared (the habitat hands them to organisms), so only
+        # ones bred inside this call, including earlier generations of it, are recycled.
+        discarded = itertools.chain(population, candidates) if generation else candidates
+        survivor_ids = {id(ind) for ind in new_generation}
+        _retire(
+            context.individual_pool,
+            (ind for ind in discarded if id(ind) not in survivor_ids),
+            2 * context.max_population_size,
+        )
         population[:] = new_generation
 
-        invalid_individuals = [ind for ind in population if not ind.fitness.valid]
-        for individual, fitness in zip(invalid_individuals, map(toolbox.evaluate, invalid_individuals)):
-            individual.fitness.values = fitness
-
+    # Each generation scores stragglers on entry, so only the final one needs a pass here.
+    _evaluate_invalid(population, context)
     return population
 
 
@@ -287,9 +555,12 @@ def evaluate_species(
     immigration_variation: float = 0.25,
     fecundity: float = 1.0,
     fecundity_variation: float = 0.15,
+    map_fn: Optional[Callable] = None,
 ) -> List:
     """
     Run a DEAP simulation that executes `generations` rounds of evolution.
+
+    `map_fn` is forwarded to `prepare_evolution` for parallel fitness evaluation.
     """
     population, context = prepare_evolution(
         population_size,
@@ -301,6 +572,7 @@ def evaluate_species(
         immigration_variation=immigration_variation,
         fecundity=fecundity,
         fecundity_variation=fecundity_variation,
+        map_fn=map_fn,
     )
     advance_population(population, context, generations=generations)
     return population
@@ -1,4 +1,5 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 from pathlib import Path
 import uuid
 
@@ -35,6 +36,7 @@ LEVEL_ALIAS_MAP = {
 }
 
 
+@lru_cache(maxsize=64)
 def _normalize_level_id(raw_value: Optional[str]) -> Optional[str]:
     if not raw_value:
         return None
@@ -42,13 +44,24 @@ def _normalize_level_id(raw_value: Optional[str]) -> Optional[str]:
     return LEVEL_ALIAS_MAP.get(key, key)
 
 
-def _build_map_context(biome_id="ocean"):
-    biome_config = _get_biome_config(biome_id)
-    biome_name = biome_config.get("name", "Evolution Simulator")
-    map_grid = biome_config.get("map", {"rows": 12, "cols": 16, "labels": []})
+@lru_cache(maxsize=8)
+def _cached_map_grid(biome_id: str) -> Dict:
+    map_grid = dict(_get_biome_config(biome_id).get("map", {"rows": 12, "cols": 16, "labels": []}))
     map_grid["label_lookup"] = {
         (label["row"] - 1, label["col"] - 1): label["text"] for label in map_grid["labels"]
     }
+    return map_grid
+
+
+def _map_grid(biome_config: Dict) -> Dict:
+    """Return the biome's map grid with its label lookup, built once per biome."""
+    return dict(_cached_map_grid(biome_config.get("id", DEFAULT_BIOME_ID)))
+
+
+def _build_map_context(biome_id="ocean"):
+    biome_config = _get_biome_config(biome_id)
+    biome_name = biome_config.get("name", "Evolution Simulator")
+    map_grid = _map_grid(biome_config)
 
     trophic_levels, evolution_state = build_trophic_levels(biome_config)
     initialize_simulation_state(trophic_levels, map_grid, evolution_state, biome_config=biome_config)
@@ -102,10 +115,7 @@ def define_species():
 
     if request.method == 'POST':
         if SIMULATION_STATE.get("biome_id") != biome_id:
-            map_grid = biome_config.get("map", {"rows": 12, "cols": 16, "labels": []})
-            map_grid["label_lookup"] = {
-                (label["row"] - 1, label["col"] - 1): label["text"] for label in map_grid["labels"]
-            }
+            map_grid = _map_grid(biome_config)
             trophic_levels, evolution_state = build_trophic_levels(biome_config)
             initialize_simulation_state(trophic_levels, map_grid, evolution_state, biome_config=biome_config)
 
@@ -1,10 +1,14 @@
 
-import copy
+import bisect
+import itertools
 import json
 import random
+from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from Organisim import Organism
 from evoultion import EvolutionContext, advance_population, prepare_evolution
@@ -13,22 +17,83 @@ DEFAULT_TRAIT_NAMES = ["Camouflage", "Metabolism", "Defense", "Senses"]
 
 """Runtime logic for orchestrating the habitat simulation loop."""
 
+def _penalties_np(genes: np.ndarray, ideal: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `_trait_penalties` for a `(count, width)` genome matrix.
+
+    Works in one float64 scratch matrix plus two row vectors, updating them in place.
+    """
+    diff = np.subtract(genes, ideal, dtype=np.float64)
+    np.abs(diff, out=diff)
+    delta = diff.sum(axis=1)
+    diff -= 0.35
+    np.maximum(diff, 0.0, out=diff)
+    harsh_excess = diff.sum(axis=1)
+    # Harshly punish genomes with traits far from ideal
+    harsh_excess *= 4.0
+    harsh_excess += 1.0
+    delta *= harsh_excess
+    return np.maximum(delta, 1e-6, out=delta)
+
+
+def _normalize_gene_pool(gene_pool) -> Optional[np.ndarray]:
+    """
+    Coerce a gene pool into a `(count, trait_count)` matrix in one step.
+
+    Matrices pass through, scalar genomes become one-trait rows, and None signals a
+    ragged pool that has to be walked genome by genome.
+    """
+    if isinstance(gene_pool, np.ndarray):
+        matrix = gene_pool
+    else:
+        try:
+            matrix = np.asarray(gene_pool, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+    if matrix.ndim == 1:
+        return matrix.reshape(-1, 1)
+    return matrix if matrix.ndim == 2 else None
+
+
+def _ragged_genomes(gene_pool: List) -> Iterable[Sequence[float]]:
+    """
+    Yield each genome of a ragged pool as a read-only sequence, wrapping bare scalar genes.
+
+    Sequences are yielded as-is rather than copied; callers only read them.
+    """
+    for genome in gene_pool:
+        yield genome if isinstance(genome, (list, tuple, np.ndarray)) else (genome,)
+
+
+def _ideal_array(ideal_traits) -> np.ndarray:
+    """Return ideal traits as a float64 vector; arrays pass through untouched."""
+    if isinstance(ideal_traits, np.ndarray):
+        return ideal_traits
+    return np.asarray(list(ideal_traits or ()), dtype=np.float64)
+
+
 def _trait_penalties(gene_pool: List, ideal_traits: Iterable[float]) -> List[float]:
-    """Weight individuals by how poorly they match the trophic targets."""
-    if not gene_pool:
+    """
+    Weight individuals by how poorly they match the trophic targets.
+
+    `ideal_traits` may be a precomputed `_ideal_array` to skip re-converting it per call.
+    """
+    if len(gene_pool) == 0:
         return []
 
-    ideal = list(ideal_traits or [])
-    if not ideal:
+    ideal_vector = _ideal_array(ideal_traits)
+    if ideal_vector.shape[0] == 0:
         return [1.0] * len(gene_pool)
 
-    penalties: List[float] = []
-    for genome in gene_pool:
-        try:
-            genome_values = list(genome)
-        except TypeError:
-            genome_values = [genome]
+    matrix = _normalize_gene_pool(gene_pool)
+    if matrix is not None:
+        width = min(matrix.shape[1], ideal_vector.shape[0])
+        return _penalties_np(matrix[:, :width], ideal_vector[:width]).tolist()
 
+    # Ragged pools fall back to the per-genome loop.
+    ideal = ideal_vector.tolist()
+    penalties: List[float] = []
+    for genome_values in _ragged_genomes(gene_pool):
         delta = 0.0
         harsh_excess = 0.0
         for gene_value, target in zip(genome_values, ideal):
@@ -44,44 +109,133 @@ def _trait_penalties(gene_pool: List, ideal_traits: Iterable[float]) -> List[flo
     return penalties
 
 
-def _apply_weighted_deaths(gene_pool: List, ideal_traits: Iterable[float], kill_count: int) -> List:
-    """Remove individuals using a roulette wheel scaled by trait penalties."""
+def _mean_penalty(gene_pool, ideal_traits: Iterable[float]) -> float:
+    """Mean of `_trait_penalties` for a non-empty pool, reduced in NumPy when it is a matrix."""
+    ideal_vector = _ideal_array(ideal_traits)
+    matrix = _normalize_gene_pool(gene_pool)
+    if matrix is None or ideal_vector.shape[0] == 0:
+        penalties = _trait_penalties(gene_pool, ideal_vector)
+        return sum(penalties) / len(penalties)
+    width = min(matrix.shape[1], ideal_vector.shape[0])
+    return float(_penalties_np(matrix[:, :width], ideal_vector[:width]).mean())
+
+
+def _cumulative_deaths(survivors: List, penalties: List[float], kill_count: int) -> List:
+    """
+    Roulette deaths drawn by bisecting a cumulative weight table.
+
+    Dead entries stay in the table and are rejected when drawn; the table is rebuilt once
+    the dead hold half of its weight, so each death costs O(log N) expected.
+    """
+    alive = [True] * len(survivors)
+    cumulative = list(itertools.accumulate(penalties))
+    dead_weight = 0.0
+    last = len(survivors) - 1
+    for _ in range(kill_count):
+        if dead_weight * 2 > cumulative[-1]:
+            weights = (penalty if living else 0.0 for penalty, living in zip(penalties, alive))
+            cumulative = list(itertools.accumulate(weights))
+            dead_weight = 0.0
+        while True:
+            index = min(bisect.bisect_right(cumulative, random.random() * cumulative[-1]), last)
+            if alive[index]:
+                break
+        alive[index] = False
+        dead_weight += penalties[index]
+
+    return list(itertools.compress(survivors, alive))
+
+
+def _apply_weighted_deaths(
+    gene_pool: List,
+    ideal_traits: Iterable[float],
+    kill_count: int,
+    penalties: Optional[List[float]] = None,
+) -> List:
+    """
+    Remove individuals using a roulette wheel scaled by trait penalties.
+
+    Uses stochastic acceptance (pick uniformly, keep the pick with probability
+    `penalty / max_penalty`) so each death costs O(1) expected draws instead of a
+    full pass over the survivors. When a few genomes dominate the weights, acceptance
+    gets rare and larger batches switch to `_cumulative_deaths`. Survivor order is not
+    preserved. Pass `penalties` when they are already known for `gene_pool`; the list is
+    consumed.
+    """
     if kill_count <= 0 or not gene_pool:
         return gene_pool
- 
+
     survivors = list(gene_pool)
-    for _ in range(min(kill_count, len(survivors))):
-        weights = _trait_penalties(survivors, ideal_traits)
-        total = sum(weights)
-        if total <= 0:
+    if penalties is None:
+        penalties = _trait_penalties(survivors, ideal_traits)
+    kill_count = min(kill_count, len(survivors))
+    max_penalty = max(penalties)
+    if kill_count >= 4 and max_penalty * len(penalties) > 4.0 * sum(penalties):
+        return _cumulative_deaths(survivors, penalties, kill_count)
+
+    for death in range(kill_count):
+        # Refresh the ceiling now and then so acceptance stays high as the worst genomes die off.
+        if death and death % 32 == 0:
+            max_penalty = max(penalties)
+        while True:
             index = random.randrange(len(survivors))
-        else:
-            threshold = random.random() * total
-            running = 0.0
-            index = len(survivors) - 1
-            for idx, weight in enumerate(weights):
-                running += weight
-                if threshold <= running:
-                    index = idx
-                    break
-        survivors.pop(index)
+            if random.random() * max_penalty <= penalties[index]:
+                break
+        survivors[index] = survivors[-1]
+        penalties[index] = penalties[-1]
+        survivors.pop()
+        penalties.pop()
 
     return survivors
 
 
+def _largest_remainder(shares: Iterable[float], total: int, minimum: int = 0) -> List[int]:
+    """
+    Split `total` into integer counts proportional to `shares` (Hamilton's method).
+
+    Every slot first gets `minimum`; the rest goes to the floors of the exact quotas, and
+    the leftover units to the largest fractional remainders. Counts always sum to `total`
+    unless `total` cannot cover the minimums, in which case every slot gets `minimum`.
+    """
+    weights = np.asarray(list(shares), dtype=np.float64)
+    slots = weights.shape[0]
+    if slots == 0:
+        return []
+    remaining = total - minimum * slots
+    if remaining <= 0:
+        return [minimum] * slots
+
+    weight_total = weights.sum()
+    if weight_total <= 0:
+        weights = np.ones(slots)
+        weight_total = float(slots)
+    quotas = weights * (remaining / weight_total)
+    counts = np.floor(quotas).astype(np.int64)
+    leftover = remaining - int(counts.sum())
+    if leftover > 0:
+        counts[np.argsort(counts - quotas, kind="stable")[:leftover]] += 1
+    counts += minimum
+    return counts.tolist()
+
+
+def _gene_pool(organism: Organism):
+    """Return an organism's genes as its cached matrix, or the raw list when genomes are ragged."""
+    matrix = organism.getGeneMatrix()
+    return matrix if matrix is not None else (organism.getGenes() or [])
+
+
 def _average_genome(gene_pool: List) -> List[float]:
     """Return the mean value for each gene position in the population."""
-    if not gene_pool:
+    if len(gene_pool) == 0:
         return []
 
+    matrix = _normalize_gene_pool(gene_pool)
+    if matrix is not None:
+        return [round(mean, 4) for mean in matrix.mean(axis=0, dtype=np.float64).tolist()]
+
     totals: List[float] = []
     counts: List[int] = []
-    for genome in gene_pool:
-        try:
-            values = list(genome)
-        except TypeError:
-            values = [genome]
-
+    for values in _ragged_genomes(gene_pool):
         if len(values) > len(totals):
             totals.extend(0.0 for _ in range(len(values) - len(totals)))
             counts.extend(0 for _ in range(len(values) - len(counts)))
@@ -98,126 +252,231 @@ def _average_genome(gene_pool: List) -> List[float]:
 
 def _clamp_step(value: int) -> int:
     """Normalize a delta to -1, 0, or 1 so movement stays grid-aligned."""
-    if value > 0:
-        return 1
-    if value < 0:
-        return -1
-    return 0
-
-
-def _direction_towards(source: Organism, target: Organism) -> Tuple[int, int]:
-    """Return the single-step direction vector from source to target."""
-    row_delta = target.getY() - source.getY()
-    col_delta = target.getX() - source.getX()
-    return _clamp_step(row_delta), _clamp_step(col_delta)
-
-
-def _direction_from_levels(origin: Organism, level_ids: List[str], toward: bool) -> Tuple[int, int]:
+    return (value > 0) - (value < 0)
+
+
+@dataclass
+class _PositionSnapshot:
+    """Organism positions for one tick, laid out as arrays for nearest-neighbour scans."""
+
+    index: Dict[str, int]
+    rows: np.ndarray
+    cols: np.ndarray
+    levels: List[Optional[str]]
+    _level_masks: Dict[Tuple[str, ...], np.ndarray] = field(default_factory=dict)
+    _pairwise: Optional[np.ndarray] = None
+
+    def level_mask(self, level_ids: Iterable[str]) -> np.ndarray:
+        """Boolean mask of organisms on any of `level_ids`, cached per level set."""
+        key = tuple(level_ids)
+        mask = self._level_masks.get(key)
+        if mask is None:
+            wanted = set(key)
+            mask = np.fromiter((level in wanted for level in self.levels), dtype=bool, count=len(self.levels))
+            self._level_masks[key] = mask
+        return mask
+
+    def distances_from(self, position: int) -> np.ndarray:
+        """Manhattan distance from the organism at `position` to every organism (a fresh copy)."""
+        if self._pairwise is None:
+            # One broadcast per tick covers every organism's scan instead of one pass each.
+            self._pairwise = np.abs(self.rows[:, None] - self.rows[None, :])
+            self._pairwise += np.abs(self.cols[:, None] - self.cols[None, :])
+        return self._pairwise[position].copy()
+
+    def move(self, position: int, row: int, col: int) -> None:
+        """Record an applied move so later passes in the tick see the new cell."""
+        self.rows[position] = row
+        self.cols[position] = col
+        self._pairwise = None
+
+    def shared_cells(self) -> List[np.ndarray]:
+        """Indices of organisms sharing a cell, one array per crowded cell, each in lookup order."""
+        if len(self.rows) < 2:
+            return []
+        keys = self.rows * (int(self.cols.max()) + 1) + self.cols
+        # A stable sort groups equal cells while keeping lookup order inside each group.
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        sizes = np.diff(np.r_[starts, len(keys)])
+        return [order[start:start + size] for start, size in zip(starts, sizes) if size > 1]
+
+    def direction(self, origin: int, target: int, toward: bool) -> Tuple[int, int]:
+        """Single-step direction from `origin` to `target`, or away from it."""
+        row_step = _clamp_step(int(self.rows[target] - self.rows[origin]))
+        col_step = _clamp_step(int(self.cols[target] - self.cols[origin]))
+        return (row_step, col_step) if toward else (-row_step, -col_step)
+
+
+def _snapshot_positions(organism_lookup: Dict[str, Organism], level_lookup: Dict[str, str]) -> _PositionSnapshot:
+    """Capture every organism's position and level once so movement planning can scan arrays."""
+    count = len(organism_lookup)
+    organisms = organism_lookup.values()
+    return _PositionSnapshot(
+        index={organism_id: position for position, organism_id in enumerate(organism_lookup)},
+        rows=np.fromiter((organism.getY() for organism in organisms), dtype=np.int64, count=count),
+        cols=np.fromiter((organism.getX() for organism in organisms), dtype=np.int64, count=count),
+        # Levels only change when state is re-initialised, so one lookup per tick serves every pass.
+        levels=[level_lookup.get(organism_id) for organism_id in organism_lookup],
+    )
+
+
+def _direction_from_levels(
+    origin: Organism,
+    level_ids: List[str],
+    toward: bool,
+    positions: _PositionSnapshot,
+) -> Tuple[int, int]:
     """Pick the direction toward or away from the nearest organism in the supplied levels."""
     if not level_ids:
         return 0, 0
 
-    closest: Tuple[int, int] = (0, 0)
-    closest_distance = None
-
-    for candidate in SIMULATION_STATE["organisms"].values():
-        if candidate.id == origin.id:
-            continue
-        candidate_level = SIMULATION_STATE["level_lookup"].get(candidate.id)
-        if candidate_level not in level_ids:
-            continue
-
-        direction = _direction_towards(origin, candidate)
-        if direction == (0, 0):
-            closest = direction
-            closest_distance = 0
-            break
-
-        manhattan = abs(candidate.getY() - origin.getY()) + abs(candidate.getX() - origin.getX())
-        if closest_distance is None or manhattan < closest_distance:
-            closest = direction
-            closest_distance = manhattan
-
-    if closest_distance is None:
+    origin_position = positions.index[origin.id]
+    candidates = positions.level_mask(level_ids).copy()
+    candidates[origin_position] = False
+    if not candidates.any():
         return 0, 0
 
-    return closest if toward else (-closest[0], -closest[1])
+    # argmin keeps the first of equally near candidates, matching lookup order.
+    distances = positions.distances_from(origin_position)
+    distances[~candidates] = np.iinfo(distances.dtype).max
+    return positions.direction(origin_position, int(distances.argmin()), toward)
 
 
-def _direction_from_targets(origin, target_ids, toward):
+def _direction_from_targets(origin, target_ids, toward, positions: _PositionSnapshot):
     """Pick the direction toward or away from specific organism ids."""
     if not target_ids:
         return 0, 0
 
-    closest: Tuple[int, int] = (0, 0)
-    closest_distance = None
-
-    for target_id in target_ids:
-        candidate = SIMULATION_STATE["organisms"].get(target_id)
-        if candidate is None or candidate.id == origin.id:
-            continue
-
-        direction = _direction_towards(origin, candidate)
-        if direction == (0, 0):
-            closest = direction
-            closest_distance = 0
-            break
-
-        manhattan = abs(candidate.getY() - origin.getY()) + abs(candidate.getX() - origin.getX())
-        if closest_distance is None or manhattan < closest_distance:
-            closest = direction
-            closest_distance = manhattan
-
-    if closest_distance is None:
+    index = positions.index
+    candidates = [index[target_id] for target_id in target_ids if target_id in index and target_id != origin.id]
+    if not candidates:
         return 0, 0
 
-    return closest if toward else (-closest[0], -closest[1])
-
-
-def _calculate_move_delta(organism: Organism, relations: Dict[str, List[str]], current_step: int, speed: int):
-    """Blend prey pursuit, predator avoidance, and randomness into a movement vector."""
+    origin_position = index[origin.id]
+    distances = positions.distances_from(origin_position)[candidates]
+    return positions.direction(origin_position, candidates[int(distances.argmin())], toward)
+
+
+def _movement_draws(count: int) -> List[List[int]]:
+    """
+    Pre-draw the random part of `count` organisms' moves in a few batched calls.
+
+    Each row holds the row/col jitter, the row/col fallback step, and the sign used when
+    the fallback is still (0, 0). A jitter is a uniform pick from {-1, 0, 1} made with
+    probability RANDOM_DIRECTION_CHANCE, so it is drawn directly from that mixture.
+    """
+    jitter_chance = RANDOM_DIRECTION_CHANCE / 3
+    steps = np.empty((count, 5), dtype=np.int64)
+    steps[:, :2] = _MOVEMENT_RNG.choice(
+        (-1, 0, 1),
+        size=(count, 2),
+        p=(jitter_chance, 1.0 - 2 * jitter_chance, jitter_chance),
+    )
+    steps[:, 2:4] = _MOVEMENT_RNG.integers(-1, 2, size=(count, 2))
+    steps[:, 4] = 2 * _MOVEMENT_RNG.integers(0, 2, size=count) - 1
+    return steps.tolist()
+
+
+def _cached_average_genome(organism: Organism, genes) -> List[float]:
+    """
+    `_average_genome` for an organism's current pool, reused while the pool is unchanged.
+
+    The gene matrix is rebuilt whenever `setGenes` runs, so its identity marks the
+    version the stored average belongs to; list pools are averaged every time.
+    """
+    if not isinstance(genes, np.ndarray):
+        return _average_genome(genes)
+    averages = SIMULATION_STATE["average_genomes"]
+    cached = averages.get(organism.id)
+    if cached is None or cached[0] is not genes:
+        cached = (genes, _average_genome(genes))
+        averages[organism.id] = cached
+    return cached[1]
+
+
+def _capture_quality(organism: Organism) -> float:
+    """Translate an organism's mean trait penalty into a catch/escape skill score."""
+    gene_pool = _gene_pool(organism)
+    # If the population has no genes, treat quality as very poor.
+    if len(gene_pool) == 0:
+        return 0.1
+    quality = 1.0 / (1.0 + _mean_penalty(gene_pool, organism.getEffectiveIdealTraits()))
+    return max(0.01, min(0.99, quality))
+
+
+def _capture_qualities(organisms: List[Organism]) -> np.ndarray:
+    """
+    Capture quality for each organism, in the order given.
+
+    Penalties only move when genomes or ideals do, so the caller keeps the result in
+    `SIMULATION_STATE["capture_quality"]` until the next cycle reshapes the populations.
+    """
+    return np.fromiter((_capture_quality(organism) for organism in organisms), dtype=float, count=len(organisms))
+
+
+def _calculate_move_delta(
+    organism: Organism,
+    relations: Dict[str, List[str]],
+    current_step: int,
+    speed: int,
+    behavior: Optional[Dict[str, List[str]]] = None,
+    positions: Optional[_PositionSnapshot] = None,
+    draws: Optional[List[int]] = None,
+):
+    """
+    Blend prey pursuit, predator avoidance, and randomness into a movement vector.
+
+    Pass the organism's `behavior` entry, the tick's `positions` snapshot, and its row
+    of `_movement_draws` when planning several organisms at once.
+    """
+    if draws is None:
+        draws = _movement_draws(1)[0]
+    if behavior is None:
+        behavior = _behavior_lookup().get(organism.id, {})
+    if positions is None:
+        positions = _snapshot_positions(SIMULATION_STATE["organisms"], SIMULATION_STATE["level_lookup"])
     prey_levels = relations.get("prey", [])
     predator_levels = relations.get("predators", [])
 
-    behavior = _behavior_lookup().get(organism.id, {})
     specific_prey_ids = behavior.get("prey_ids", [])
     specific_predator_ids = behavior.get("predator_ids", [])
 
-    prey_direction = _direction_from_targets(organism, specific_prey_ids, toward=True)
-    if prey_direction == (0, 0):
-        prey_direction = _direction_from_levels(organism, prey_levels, toward=True)
-
-    predator_direction = _direction_from_targets(organism, specific_predator_ids, toward=False)
-    if predator_direction == (0, 0):
-        predator_direction = _direction_from_levels(organism, predator_levels, toward=False)
+    hunts = bool(prey_levels or specific_prey_ids)
+    # On the last step a hungry hunter heads straight for prey, so predators are not scanned.
+    last_chance = hunts and current_step >= MAX_CYCLE_STEPS - 1 and not organism.hasCaughtPrey()
 
-    prey_weight = max(2, speed) if (prey_levels or specific_prey_ids) else 1
-    if specific_prey_ids:
-        prey_weight = max(prey_weight, speed + 1)
+    prey_direction = _direction_from_targets(organism, specific_prey_ids, True, positions)
+    if prey_direction == (0, 0):
+        prey_direction = _direction_from_levels(organism, prey_levels, True, positions)
 
-    if (
-        (prey_levels or specific_prey_ids)
-        and not organism.hasCaughtPrey()
-        and current_step >= MAX_CYCLE_STEPS - 1
-    ):
+    if last_chance:
         base_row, base_col = prey_direction
     else:
+        predator_direction = _direction_from_targets(organism, specific_predator_ids, False, positions)
+        if predator_direction == (0, 0):
+            predator_direction = _direction_from_levels(organism, predator_levels, False, positions)
+
+        prey_weight = max(2, speed) if hunts else 1
+        if specific_prey_ids:
+            prey_weight = max(prey_weight, speed + 1)
+
         base_row = prey_direction[0] * prey_weight + predator_direction[0]
         base_col = prey_direction[1] * prey_weight + predator_direction[1]
 
-    if random.random() < RANDOM_DIRECTION_CHANCE:
-        base_row += random.choice([-1, 0, 1])
-    if random.random() < RANDOM_DIRECTION_CHANCE:
-        base_col += random.choice([-1, 0, 1])
+    row_jitter, col_jitter, row_fallback, col_fallback, fallback_sign = draws
+    base_row += row_jitter
+    base_col += col_jitter
 
     row_step = _clamp_step(base_row)
     col_step = _clamp_step(base_col)
 
     if row_step == 0 and col_step == 0:
-        row_step = random.choice([-1, 0, 1])
-        col_step = random.choice([-1, 0, 1])
+        row_step = row_fallback
+        col_step = col_fallback
         if row_step == 0 and col_step == 0:
-            row_step = random.choice([-1, 1])
+            row_step = fallback_sign
 
     row_delta = max(-speed, min(speed, row_step * speed))
     col_delta = max(-speed, min(speed, col_step * speed))
@@ -228,19 +487,18 @@ def resolvePredation(organism_lookup, cycle_summary):
     level_lookup = SIMULATION_STATE.get("level_lookup", {})
     relations_map = _relations_lookup()
     behavior_map = _behavior_lookup()
+    no_relations: Dict[str, List[str]] = {}
+    no_behavior: Dict[str, List[str]] = {}
 
     for organism in organism_lookup.values():
-        genes = list(organism.getGenes() or [])
-        population_size = len(genes)
+        population_size = organism.getSize()
         if population_size == 0:
             continue
 
-        ideal_traits = organism.getEffectiveIdealTraits()
-        level_id = level_lookup.get(organism.getId())
-        relations = relations_map.get(level_id, {"prey": [], "predators": []})
-        prey_levels = relations.get("prey", [])
-        behavior = behavior_map.get(organism.id, {})
-        prey_ids = behavior.get("prey_ids", [])
+        organism_id = organism.id
+        relations = relations_map.get(level_lookup.get(organism_id), no_relations)
+        prey_levels = relations.get("prey")
+        prey_ids = behavior_map.get(organism_id, no_behavior).get("prey_ids")
 
         catches_made = organism.getCaughtPreyCount()
         times_caught = organism.getTimesCaught()
@@ -251,22 +509,21 @@ def resolvePredation(organism_lookup, cycle_summary):
             starvation_rate = 0.6 / (1.0 + 0.8 * catches_made)
             starvation_rate = max(0.01, min(0.6, starvation_rate))
 
-        if starvation_rate > 0.0 and population_size:
-            losses = int(round(population_size * starvation_rate))
-            genes = _apply_weighted_deaths(genes, ideal_traits, losses)
-            population_size = len(genes)
-
         predation_rate = 0.0
-        if times_caught > 0 and population_size:
+        if times_caught > 0:
             # Smoothly scale harm from being caught; grows quickly then caps.
             predation_rate = min(0.6, 0.06 * pow(times_caught, 1.2))
 
-        if predation_rate > 0.0 and population_size:
-            losses = int(round(population_size * predation_rate))
-            genes = _apply_weighted_deaths(genes, ideal_traits, losses)
+        # Starvation and predation strike independently, so one pass at the combined rate
+        # removes the same expected share as starving first and culling the rest.
+        mortality = 1.0 - (1.0 - starvation_rate) * (1.0 - predation_rate)
+        losses = int(round(population_size * mortality))
+        if losses <= 0:
+            continue
 
-        organism.setGenes(genes)
-        organism.setSize(len(genes))
+        ideal_traits = _ideal_array(organism.getEffectiveIdealTraits())
+        penalties = _trait_penalties(_gene_pool(organism), ideal_traits)
+        organism.setGenes(_apply_weighted_deaths(organism.getGenes(), ideal_traits, losses, penalties=penalties))
 
     return 1
 
@@ -280,6 +537,10 @@ def _advance_evolution_cycle() -> None:
     organism_lookup = SIMULATION_STATE.get("organisms", {})
     level_lookup = SIMULATION_STATE.get("level_lookup", {})
 
+    members_by_level: Dict[Optional[str], List[Organism]] = {}
+    for organism in organism_lookup.values():
+        members_by_level.setdefault(level_lookup.get(organism.id), []).append(organism)
+
     for level_id, data in evolution_state.items():
         population = data.get("population")
         context = data.get("context")
@@ -287,33 +548,24 @@ def _advance_evolution_cycle() -> None:
         if population is None or context is None:
             continue
 
-        members = [
-            organism
-            for organism in organism_lookup.values()
-            if level_lookup.get(organism.id) == level_id
-        ]
+        members = members_by_level.get(level_id, [])
         if not members:
             population.clear()
             continue
 
         # Capture current distribution after predation.
-        share_values = [len(member.getGenes() or []) for member in members]
-        aggregated: List = []
-        for member in members:
-            aggregated.extend(member.getGenes() or [])
-
-        population[:] = aggregated
+        share_values = [member.getSize() for member in members]
+        population[:] = itertools.chain.from_iterable(member.getGenes() or [] for member in members)
         override_targets = None
         for member in members:
             effective_traits = member.getEffectiveIdealTraits()
             if effective_traits:
                 override_targets = tuple(effective_traits)
                 break
-        context.target_traits_override = override_targets
+        context.set_target_override(override_targets)
         if not population:
             for member in members:
                 member.setGenes([])
-                member.setSize(0)
             continue
 
         if generations:
@@ -323,55 +575,16 @@ def _advance_evolution_cycle() -> None:
         if total_population == 0:
             for member in members:
                 member.setGenes([])
-                member.setSize(0)
             continue
 
-        total_shares = sum(share_values)
-        if total_shares <= 0:
-            share_values = [1 for _ in members]
-            total_shares = len(share_values) or 1
-
-        counts = []
-        for share in share_values:
-            fraction = share / total_shares if total_shares else 0.0
-            counts.append(int(round(total_population * fraction)))
-
-        allocated = sum(counts)
-        idx = 0
-        while allocated != total_population and members:
-            slot = idx % len(counts)
-            if allocated < total_population:
-                counts[slot] += 1
-                allocated += 1
-            else:
-                if counts[slot] > 0:
-                    counts[slot] -= 1
-                    allocated -= 1
-            idx += 1
-            if idx > len(counts) * 8:
-                break
+        # Shares with no weight at all are split evenly; the split is exact, so nobody is left over.
+        counts = _largest_remainder(share_values, total_population)
 
+        # Slicing already copies, so each member gets its own list without a second pass.
         population_index = 0
         for member, count in zip(members, counts):
-            take = min(count, len(population) - population_index)
-            assigned = []
-            if take > 0:
-                assigned = list(population[population_index : population_index + take])
-                population_index += take
-            member.setGenes(assigned)
-            member.setSize(len(assigned))
-
-        if population_index < len(population) and members:
-            extras = list(population[population_index:])
-            if extras:
-                richest = max(
-                    members,
-                    key=lambda organism: len(organism.getGenes() or []), #returns len(organism.getGenes) if existent if not len([]) which is 0
-                ) 
-                updated = list(richest.getGenes() or [])
-                updated.extend(extras)
-                richest.setGenes(updated)
-                richest.setSize(len(updated))
+            member.setGenes(population[population_index : population_index + count])
+            population_index += count
 
 DEFAULT_BIOME_ID = "ocean"
 
@@ -491,6 +704,8 @@ DEFAULT_SPEED_BY_LEVEL = {
 
 # Random move jitter keeps paths from looking overly deterministic.
 RANDOM_DIRECTION_CHANCE = 0.5
+# Movement randomness is drawn per tick in batches rather than one call at a time.
+_MOVEMENT_RNG = np.random.default_rng()
 
 DEFAULT_TROPHIC_RELATIONS = {
     "producers": {"prey": [], "predators": ["primary-consumers"]},
@@ -596,41 +811,67 @@ SIMULATION_STATE: Dict = {
     "relations": DEFAULT_TROPHIC_RELATIONS,
     "speed_by_level": DEFAULT_SPEED_BY_LEVEL,
     "behaviors": OCEAN_ORGANISM_BEHAVIORS,
+    "capture_quality": None,
+    "average_genomes": {},
+    "movement_profiles": {},
 }
 
-STATE_LOG_PATH = Path(__file__).resolve().parent.parent / "simulation_state.json"
+# One JSON record per line; a later record for the same cycle supersedes earlier ones.
+STATE_LOG_PATH = Path(__file__).resolve().parent.parent / "simulation_state.jsonl"
+# Shared compact encoder; json.dumps would build a fresh one for every non-default call.
+_HISTORY_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+def _clone(value):
+    """Deep-copy JSON-shaped config data (dicts, lists, scalars) without deepcopy's memo machinery."""
+    if type(value) is dict:
+        return {key: _clone(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_clone(item) for item in value]
+    return value
+
 
 def _compose_biome_config(preset: Dict) -> Dict:
     """Build a full biome config by merging shared level settings with biome organisms."""
-    resolved = copy.deepcopy(preset)
+    resolved = _clone(preset)
     organisms_by_level = resolved.get("organisms", {})
     trait_names_override = resolved.get("trait_names")
 
     trophic_levels: List[Dict] = []
     for level_id in LEVEL_ORDER:
-        base_level = copy.deepcopy(BASE_LEVEL_SETTINGS.get(level_id, {}))
+        base_level = _clone(BASE_LEVEL_SETTINGS.get(level_id, {}))
         base_level["trait_names"] = trait_names_override or base_level.get("trait_names") or DEFAULT_TRAIT_NAMES
-        base_level["organisms"] = copy.deepcopy(organisms_by_level.get(level_id, []))
+        # `resolved` is already a private copy, so its organism lists can be used as they are.
+        base_level["organisms"] = organisms_by_level.get(level_id, [])
         trophic_levels.append(base_level)
 
     resolved["trophic_levels"] = trophic_levels
-    resolved["map"] = copy.deepcopy(resolved.get("map", {"rows": 12, "cols": 16, "labels": []}))
-    resolved["relations"] = copy.deepcopy(resolved.get("relations", DEFAULT_TROPHIC_RELATIONS))
-    resolved["speed_by_level"] = copy.deepcopy(resolved.get("speed_by_level", DEFAULT_SPEED_BY_LEVEL))
-    resolved["behaviors"] = copy.deepcopy(resolved.get("behaviors", {}))
+    resolved.setdefault("map", {"rows": 12, "cols": 16, "labels": []})
+    resolved.setdefault("relations", _clone(DEFAULT_TROPHIC_RELATIONS))
+    resolved.setdefault("speed_by_level", _clone(DEFAULT_SPEED_BY_LEVEL))
+    resolved.setdefault("behaviors", {})
     return resolved
 
+
+# The presets are constants, so compose each one once at import; the results are shared.
+_COMPOSED_BIOMES: Dict[str, Dict] = {
+    biome_id: _compose_biome_config(preset) for biome_id, preset in BIOME_PRESETS.items()
+}
+
+
 def _get_biome_config(biome_id: Optional[str]) -> Dict:
-    """Return a deep copy of the biome preset so mutations stay scoped."""
+    """
+    Return the active or preset biome config.
+
+    The result is shared with the preset cache and the simulation state; treat it as
+    read-only and copy whatever part you need to change (see `replace_first_species`).
+    """
     requested = biome_id or SIMULATION_STATE.get("biome_id") or DEFAULT_BIOME_ID
     cached_config = SIMULATION_STATE.get("biome_config") or {}
 
     if cached_config.get("id") == requested:
-        return copy.deepcopy(cached_config)
+        return cached_config
 
-    fallback = BIOME_PRESETS.get(DEFAULT_BIOME_ID, {})
-    base = BIOME_PRESETS.get(requested, fallback)
-    return _compose_biome_config(base or fallback)
+    return _COMPOSED_BIOMES.get(requested) or _COMPOSED_BIOMES[DEFAULT_BIOME_ID]
 
 
 def _relations_lookup() -> Dict[str, Dict[str, List[str]]]:
@@ -645,6 +886,22 @@ def _behavior_lookup() -> Dict[str, Dict[str, List[str]]]:
     return SIMULATION_STATE.get("behaviors") or {}
 
 
+def _movement_profiles(level_lookup: Dict[str, str]) -> Dict[str, Tuple[Dict[str, List[str]], int, Dict[str, List[str]]]]:
+    """Each organism's (relations, speed, behavior), fixed until the state is re-initialised."""
+    relations_map = _relations_lookup()
+    speed_map = _speed_lookup()
+    behavior_map = _behavior_lookup()
+    no_relations: Dict[str, List[str]] = {"prey": [], "predators": []}
+    return {
+        organism_id: (
+            relations_map.get(level_id, no_relations),
+            speed_map.get(level_id, 1),
+            behavior_map.get(organism_id, {}),
+        )
+        for organism_id, level_id in level_lookup.items()
+    }
+
+
 def _prune_extinct_species() -> List[str]:
     """Remove organisms with zero population and track them as extinct."""
     organism_lookup = SIMULATION_STATE.get("organisms", {})
@@ -673,19 +930,12 @@ def _run_simulation(settings: Dict) -> Tuple[List, EvolutionContext]:
     seed = settings.get("seed")
     simulation_kwargs = {key: value for key, value in settings.items() if key != "seed"}
     generations = simulation_kwargs.pop("generations", 0)
-    previous_state = None
-    if seed is not None:
-        previous_state = random.getstate()
-        random.seed(seed)
+    rng = random.Random(seed) if seed is not None else None
 
-    try:
-        population, context = prepare_evolution(**simulation_kwargs)
-        if generations:
-            advance_population(population, context, generations=generations)
-        return population, context
-    finally:
-        if previous_state is not None:
-            random.setstate(previous_state)
+    population, context = prepare_evolution(**simulation_kwargs, rng=rng)
+    if generations:
+        advance_population(population, context, generations=generations)
+    return population, context
 
 
 def build_trophic_levels(
@@ -714,28 +964,8 @@ def build_trophic_levels(
            continue
         else:
             shares = [organism.get("share", 1.0) for organism in organism_configs]
-            share_total = sum(shares) if any(shares) else float(len(organism_configs) or 1)
-            counts: List[int] = []
-
-            for share in shares:
-                fraction = (share / share_total) if share_total else 0.0
-                estimated = int(round(population_count * fraction))
-                counts.append(max(1, estimated))
-
-            allocated = sum(counts)
-            idx = 0
-            while allocated != population_count and organism_configs:
-                slot = idx % len(counts)
-                if allocated < population_count:
-                    counts[slot] += 1
-                    allocated += 1
-                else:
-                    if counts[slot] > 1:
-                        counts[slot] -= 1
-                        allocated -= 1
-                idx += 1
-                if idx > len(counts) * 8:
-                    break
+            # Every configured organism starts with at least one individual when the level allows it.
+            counts = _largest_remainder(shares, population_count, minimum=1)
 
             population_index = 0
             for index, organism_cfg in enumerate(organism_configs):
@@ -751,26 +981,15 @@ def build_trophic_levels(
                     organism_cfg["name"],
                     organism_cfg["row"],
                     organism_cfg["col"],
-                    len(assigned),
-                    organism_cfg["image"],
+                    ip=organism_cfg["image"],
                     moves=organism_cfg.get("moves", True),
                     ideal_traits=level["simulation"].get("target_traits"),
                     user_ideal_traits=organism_cfg.get("user_ideal_traits"),
                     trait_names=organism_cfg.get("trait_names", level_trait_names),
                 )
                 organism.setGenes(assigned)
-                organism.setSize(len(assigned))
                 organisms.append(organism)
 
-            if population_index < population_count and organisms:
-                extras = list(population[population_index:])
-                if extras:
-                    first = organisms[0]
-                    updated = list(first.getGenes() or [])
-                    updated.extend(extras)
-                    first.setGenes(updated)
-                    first.setSize(len(updated))
-
         trophic_levels.append(
             {
                 "id": level_id,
@@ -813,12 +1032,15 @@ def initialize_simulation_state(
         SIMULATION_STATE["cycle"] = 0
         SIMULATION_STATE["evolution"] = evolution_state
         SIMULATION_STATE["extinct"] = set()
+        SIMULATION_STATE["capture_quality"] = None
+        SIMULATION_STATE["average_genomes"] = {}
         resolved_biome = biome_config or _get_biome_config(DEFAULT_BIOME_ID)
         SIMULATION_STATE["biome_config"] = resolved_biome
         SIMULATION_STATE["biome_id"] = resolved_biome.get("id", SIMULATION_STATE.get("biome_id", DEFAULT_BIOME_ID))
         SIMULATION_STATE["relations"] = resolved_biome.get("relations") or BIOME_PRESETS[DEFAULT_BIOME_ID]["relations"]
         SIMULATION_STATE["speed_by_level"] = resolved_biome.get("speed_by_level") or BIOME_PRESETS[DEFAULT_BIOME_ID]["speed_by_level"]
         SIMULATION_STATE["behaviors"] = resolved_biome.get("behaviors") or BIOME_PRESETS[DEFAULT_BIOME_ID]["behaviors"]
+        SIMULATION_STATE["movement_profiles"] = _movement_profiles(level_lookup)
 
 
 def replace_first_species(
@@ -836,20 +1058,25 @@ def replace_first_species(
     with STATE_LOCK:
         biome_config = SIMULATION_STATE.get("biome_config") or _get_biome_config(SIMULATION_STATE.get("biome_id"))
         trophic_config = biome_config.get("trophic_levels") if isinstance(biome_config, dict) else None
-        target_level = None
-        for level in trophic_config or []:
+        level_index = None
+        for index, level in enumerate(trophic_config or []):
             if level.get("id") == level_id:
-                target_level = level
+                level_index = index
                 break
 
-        if not target_level:
+        if level_index is None:
             return False
 
-        organisms = target_level.get("organisms") or []
+        organisms = trophic_config[level_index].get("organisms") or []
         if not organisms:
             return False
 
-        primary = organisms[0]
+        # Configs are shared with the preset cache, so copy only the path down to the edited organism.
+        primary = dict(organisms[0])
+        target_level = dict(trophic_config[level_index], organisms=[primary, *organisms[1:]])
+        trophic_config = list(trophic_config)
+        trophic_config[level_index] = target_level
+        biome_config = dict(biome_config, trophic_levels=trophic_config)
         organism_id = primary.get("id")
         primary["name"] = name
         if image_path:
@@ -869,6 +1096,7 @@ def replace_first_species(
                 organism.setMoves(moves)
             if user_ideal_traits is not None:
                 organism.setUserIdealTraits(user_ideal_traits)
+                SIMULATION_STATE["capture_quality"] = None
 
         SIMULATION_STATE["biome_config"] = biome_config
         return True
@@ -880,117 +1108,101 @@ def step_simulation() -> Dict[str, Iterable[Dict]]:
         if not organism_lookup:
             return {"organisms": [], "cycleComplete": False, "cycleSummary": []}
 
-        grid = SIMULATION_STATE["grid"]
+        grid_rows, grid_cols = SIMULATION_STATE["grid"]["rows"], SIMULATION_STATE["grid"]["cols"]
         relations_map = _relations_lookup()
-        speed_map = _speed_lookup()
+        behavior_map = _behavior_lookup()
+        movement_profiles = SIMULATION_STATE["movement_profiles"]
+        level_lookup = SIMULATION_STATE["level_lookup"]
+        no_behavior: Dict[str, List[str]] = {}
         planned_moves: List[Tuple[str, int, int]] = []
         extinct_ids: List[str] = []
+        # Moves are applied only after planning, so one snapshot serves the whole tick.
+        positions = _snapshot_positions(organism_lookup, level_lookup)
+        movement_draws = _movement_draws(len(organism_lookup))
+        unfinished = 0
 
-        for organism in organism_lookup.values():
+        for organism, draws in zip(organism_lookup.values(), movement_draws):
             current_step = organism.getCycleSteps()
             if current_step >= MAX_CYCLE_STEPS:
                 continue
 
-            level_id = SIMULATION_STATE["level_lookup"].get(organism.id)
-            relations = relations_map.get(level_id, {"prey": [], "predators": []})
-            speed = speed_map.get(level_id, 1)
-
             row_delta = 0
             col_delta = 0
             if organism.canMove():
-                row_delta, col_delta = _calculate_move_delta(organism, relations, current_step, speed)
+                relations, speed, behavior = movement_profiles[organism.id]
+                row_delta, col_delta = _calculate_move_delta(
+                    organism,
+                    relations,
+                    current_step,
+                    speed,
+                    behavior,
+                    positions,
+                    draws,
+                )
 
             if row_delta or col_delta:
-                new_row = organism.getY() + row_delta
-                new_col = organism.getX() + col_delta
+                row, col = organism.getY(), organism.getX()
+                new_row = max(1, min(grid_rows, row + row_delta))
+                new_col = max(1, min(grid_cols, col + col_delta))
 
-                new_row = max(1, min(grid["rows"], new_row))
-                new_col = max(1, min(grid["cols"], new_col))
-
-                if new_row != organism.getY() or new_col != organism.getX():
+                if new_row != row or new_col != col:
                     planned_moves.append((organism.id, new_row, new_col))
 
-            organism.advanceCycle()
+            if organism.advanceCycle() < MAX_CYCLE_STEPS:
+                unfinished += 1
 
         for organism_id, new_row, new_col in planned_moves:
             organism = organism_lookup[organism_id]
             organism.setY(new_row)
             organism.setX(new_col)
-
-        position_map: Dict[Tuple[int, int], List[Organism]] = {}
-        for organism in organism_lookup.values():
-            position_map.setdefault((organism.getY(), organism.getX()), []).append(organism)
-
-        penalty_cache: Dict[str, float] = {}
-        quality_cache: Dict[str, float] = {}
-
-        def _penalty_for(organism: Organism) -> float:
-            """Cache harsh penalty so capture odds reflect trait quality."""
-            cached = penalty_cache.get(organism.id)
-            if cached is not None:
-                return cached
-            penalties = _trait_penalties(
-                organism.getGenes() or [],
-                organism.getEffectiveIdealTraits(),
-            )
-            if not penalties:
-                value = 0.0
-            else:
-                value = sum(penalties) / len(penalties)
-            penalty_cache[organism.id] = value
-            return value
-
-        def _capture_quality(organism: Organism) -> float:
-            """Translate penalties into a catch/escape skill score."""
-            cached = quality_cache.get(organism.id)
-            if cached is not None:
-                return cached
-            penalty = _penalty_for(organism)
-            # If the population has no genes, treat quality as very poor.
-            quality = 0.1 if not (organism.getGenes() or []) else 1.0 / (1.0 + penalty)
-            bounded = max(0.01, min(0.99, quality))
-            quality_cache[organism.id] = bounded
-            return bounded
-
-        for occupants in position_map.values():
-            if len(occupants) < 2:
-                continue
-            occupant_levels = {
-                organism.id: SIMULATION_STATE["level_lookup"].get(organism.id)
-                for organism in occupants
-            }
-            for organism in occupants:
-                level_id = occupant_levels.get(organism.id)
-                relations = relations_map.get(level_id, {"prey": [], "predators": []})
-                prey_levels = relations.get("prey", [])
+            positions.move(positions.index[organism_id], new_row, new_col)
+
+        organisms = list(organism_lookup.values())
+
+        # Gather every hunter/target pairing first, then settle all capture rolls in one sweep.
+        occupant_levels = positions.levels
+        prey_by_level = {level_id: relations.get("prey", []) for level_id, relations in relations_map.items()}
+        no_prey: List[str] = []
+        hunters: List[int] = []
+        targets: List[int] = []
+        for cell in positions.shared_cells():
+            cell = cell.tolist()
+            for position in cell:
+                organism = organisms[position]
                 if organism.hasCaughtPrey():
                     continue
-                behavior = _behavior_lookup().get(organism.id, {})
-                prey_ids = behavior.get("prey_ids", [])
+                prey_levels = prey_by_level.get(occupant_levels[position], no_prey)
+                prey_ids = behavior_map.get(organism.id, no_behavior).get("prey_ids", [])
                 if not prey_levels and not prey_ids:
                     continue
-                caught_targets = [
-                    other
-                    for other in occupants
-                    if other.id != organism.id
-                    and (
-                        (prey_levels and occupant_levels.get(other.id) in prey_levels)
-                        or (prey_ids and other.id in prey_ids)
-                    )
-                ]
-                if caught_targets:
-                    predator_quality = _capture_quality(organism)
-                    for prey in caught_targets:
-                        prey_quality = _capture_quality(prey)
-                        relative_edge = predator_quality / (predator_quality + prey_quality + 1e-9)
-                        success_chance = max(0.01, min(0.95, relative_edge * predator_quality))
-                        if random.random() < success_chance:
-                            organism.incrementCaughtPrey()
-                            prey.incrementTimesCaught()
-
-        cycle_complete = all(
-            organism.getCycleSteps() >= MAX_CYCLE_STEPS for organism in organism_lookup.values()
-        )
+                for other in cell:
+                    if other != position and (
+                        (prey_levels and occupant_levels[other] in prey_levels)
+                        or (prey_ids and organisms[other].id in prey_ids)
+                    ):
+                        hunters.append(position)
+                        targets.append(other)
+
+        if hunters:
+            quality = SIMULATION_STATE.get("capture_quality")
+            if quality is None:
+                quality = _capture_qualities(organisms)
+                SIMULATION_STATE["capture_quality"] = quality
+            hunter_idx = np.array(hunters)
+            target_idx = np.array(targets)
+            hunter_quality = quality[hunter_idx]
+            relative_edge = hunter_quality / (hunter_quality + quality[target_idx] + 1e-9)
+            success_chance = np.clip(relative_edge * hunter_quality, 0.01, 0.95)
+            rolls = np.fromiter((random.random() for _ in hunters), dtype=float, count=len(hunters))
+            caught = rolls < success_chance
+            catches = np.bincount(hunter_idx[caught], minlength=len(organisms))
+            captures = np.bincount(target_idx[caught], minlength=len(organisms))
+            for position in np.flatnonzero(catches).tolist():
+                organisms[position].incrementCaughtPrey(int(catches[position]))
+            for position in np.flatnonzero(captures).tolist():
+                organisms[position].incrementTimesCaught(int(captures[position]))
+
+        cycle_complete = unfinished == 0
         cycle_summary: List[Dict[str, bool]] = []
         cycle_index = SIMULATION_STATE.get("cycle", 0)
 
@@ -1018,30 +1230,27 @@ def step_simulation() -> Dict[str, Iterable[Dict]]:
                     organism.setX(home[1])
 
             extinct_ids = _prune_extinct_species()
+            SIMULATION_STATE["capture_quality"] = None
 
-        updates = []
-        for organism in organism_lookup.values():
-            genes = organism.getGenes() or []
-            population_size = len(genes)
-            average_genome = _average_genome(genes)
-            if population_size != organism.getSize():
-                organism.setSize(population_size)
-            updates.append(
-                {
-                    "id": organism.id,
-                    "row": organism.getY(),
-                    "col": organism.getX(),
-                    "caughtPrey": organism.hasCaughtPrey(),
-                    "caughtPreyCount": organism.getCaughtPreyCount(),
-                    "wasCaught": organism.wasCaught(),
-                    "timesCaught": organism.getTimesCaught(),
-                    "cycleStep": organism.getCycleSteps(),
-                    "canMove": organism.canMove(),
-                    "population": population_size,
-                    "averageGenome": average_genome,
-                    "traitNames": organism.getTraitNames(),
-                }
-            )
+        # The client reads one record per organism, so the rows are built in a single pass.
+        gene_pools = [_gene_pool(organism) for organism in organism_lookup.values()]
+        updates = [
+            {
+                "id": organism.id,
+                "row": organism.getY(),
+                "col": organism.getX(),
+                "caughtPrey": organism.hasCaughtPrey(),
+                "caughtPreyCount": organism.getCaughtPreyCount(),
+                "wasCaught": organism.wasCaught(),
+                "timesCaught": organism.getTimesCaught(),
+                "cycleStep": organism.getCycleSteps(),
+                "canMove": organism.canMove(),
+                "population": len(genes),
+                "averageGenome": _cached_average_genome(organism, genes),
+                "traitNames": organism.getTraitNames(),
+            }
+            for organism, genes in zip(organism_lookup.values(), gene_pools)
+        ]
 
         if cycle_complete:
 
@@ -1059,7 +1268,7 @@ def step_simulation() -> Dict[str, Iterable[Dict]]:
 
 
 def persist_simulation_state(cycle, summary, organisms) -> None:
-    """Append or replace historical cycle state on disk for later inspection."""
+    """Append historical cycle state on disk; re-saving a cycle replaces it for readers."""
     entry = {
         "cycle": cycle,
         "summary": summary,
@@ -1067,21 +1276,33 @@ def persist_simulation_state(cycle, summary, organisms) -> None:
     }
 
     with STATE_LOCK:
-        history: List[Dict] = []
-        if STATE_LOG_PATH.exists():
-            try:
-                history = json.loads(STATE_LOG_PATH.read_text())
-                if not isinstance(history, list):
-                    history = []
-            except (OSError, json.JSONDecodeError):
-                history = []
+        with STATE_LOG_PATH.open("a") as handle:
+            handle.write(_HISTORY_ENCODER.encode(entry) + "\n")
 
-        filtered = [item for item in history if item.get("cycle") != cycle]
-        filtered.append(entry)
-        STATE_LOG_PATH.write_text(json.dumps(filtered, indent=2))
+
+def load_simulation_history() -> List[Dict]:
+    """Read the on-disk history, keeping the last record saved for each cycle."""
+    with STATE_LOCK:
+        try:
+            lines = STATE_LOG_PATH.read_text().splitlines()
+        except OSError:
+            return []
+
+    latest: Dict[object, Dict] = {}
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # A torn final line from an interrupted write carries no usable state.
+            continue
+        if isinstance(entry, dict):
+            # Re-inserting moves a replaced cycle to the end, as a rewrite would have.
+            latest.pop(entry.get("cycle"), None)
+            latest[entry.get("cycle")] = entry
+    return list(latest.values())
 
 
 def reset_simulation_history() -> None:
     """Clear the on-disk simulation history."""
     with STATE_LOCK:
-        STATE_LOG_PATH.write_text(json.dumps([], indent=2))
+        STATE_LOG_PATH.write_text("")